@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import time
 from typing import Any, Callable, Optional, Union
 from warnings import warn
 
@@ -30,6 +32,9 @@ class AsyncToolboxClient:
         self,
         url: str,
         session: ClientSession,
+        manifest_cache_ttl: float = 0,
+        auth_token_ttl: float = 0,
+        validate_inputs: bool = True,
     ):
         """
         Initializes the AsyncToolboxClient for the Toolbox service at the given URL.
@@ -37,9 +42,51 @@ class AsyncToolboxClient:
         Args:
             url: The base URL of the Toolbox service.
             session: An HTTP client session.
+            manifest_cache_ttl: The number of seconds a fetched manifest is
+                reused before it is requested again. Caching is disabled by
+                default.
+            auth_token_ttl: The number of seconds an ID token retrieved from
+                the `auth_tokens` of a loaded tool is reused across invocations
+                before it is retrieved again. Tokens are retrieved on every
+                invocation by default.
+            validate_inputs: If True, loaded tools validate the arguments of
+                each invocation against the tool schema before invoking the
+                tool. Set to False if the arguments are already validated by
+                the caller.
         """
         self.__url = url
+        self.__tool_endpoint = f"{url}/api/tool/"
+        self.__toolset_endpoint = f"{url}/api/toolset/"
         self.__session = session
+        self.__manifest_cache_ttl = manifest_cache_ttl
+        self.__auth_token_ttl = auth_token_ttl
+        self.__validate_inputs = validate_inputs
+        self.__manifest_cache: dict[str, tuple[float, ManifestSchema]] = {}
+
+    async def __load_manifest(self, url: str) -> ManifestSchema:
+        """
+        Fetches the manifest at the given URL, reusing a cached copy if it has
+        not yet expired.
+
+        Args:
+            url: The URL to fetch the manifest from.
+
+        Returns:
+            The parsed Toolbox manifest.
+        """
+        if self.__manifest_cache_ttl <= 0:
+            return await _load_manifest(url, self.__session)
+
+        cached = self.__manifest_cache.get(url)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        manifest = await _load_manifest(url, self.__session)
+        self.__manifest_cache[url] = (
+            time.monotonic() + self.__manifest_cache_ttl,
+            manifest,
+        )
+        return manifest
 
     async def aload_tool(
         self,
@@ -79,8 +126,8 @@ class AsyncToolboxClient:
                 )
                 auth_tokens = auth_headers
 
-        url = f"{self.__url}/api/tool/{tool_name}"
-        manifest: ManifestSchema = await _load_manifest(url, self.__session)
+        url = self.__tool_endpoint + tool_name
+        manifest: ManifestSchema = await self.__load_manifest(url)
 
         return AsyncToolboxTool(
             tool_name,
@@ -90,8 +137,74 @@ class AsyncToolboxClient:
             auth_tokens,
             bound_params,
             strict,
+            auth_token_ttl=self.__auth_token_ttl,
+            validate_inputs=self.__validate_inputs,
+        )
+
+    async def aload_tools(
+        self,
+        tool_names: list[str],
+        auth_tokens: dict[str, Callable[[], str]] = {},
+        auth_headers: Optional[dict[str, Callable[[], str]]] = None,
+        bound_params: dict[str, Union[Any, Callable[[], Any]]] = {},
+        strict: bool = True,
+    ) -> list[AsyncToolboxTool]:
+        """
+        Loads the tools with the given tool names from the Toolbox service.
+
+        The tool manifests are fetched concurrently, so loading N tools takes
+        roughly as long as loading a single one.
+
+        Args:
+            tool_names: The names of the tools to load.
+            auth_tokens: An optional mapping of authentication source names to
+                functions that retrieve ID tokens.
+            auth_headers: Deprecated. Use `auth_tokens` instead.
+            bound_params: An optional mapping of parameter names to their
+                bound values.
+            strict: If True, raises a ValueError if any of the given bound
+                parameters are missing from the schema or require
+                authentication. If False, only issues a warning.
+
+        Returns:
+            A list of tools loaded from the Toolbox, in the order of the given
+            tool names.
+        """
+        if auth_headers:
+            if auth_tokens:
+                warn(
+                    "Both `auth_tokens` and `auth_headers` are provided. `auth_headers` is deprecated, and `auth_tokens` will be used.",
+                    DeprecationWarning,
+                )
+            else:
+                warn(
+                    "Argument `auth_headers` is deprecated. Use `auth_tokens` instead.",
+                    DeprecationWarning,
+                )
+                auth_tokens = auth_headers
+
+        manifests: list[ManifestSchema] = await asyncio.gather(
+            *(
+                self.__load_manifest(self.__tool_endpoint + tool_name)
+                for tool_name in tool_names
+            )
         )
 
+        return [
+            AsyncToolboxTool(
+                tool_name,
+                manifest.tools[tool_name],
+                self.__url,
+                self.__session,
+                auth_tokens,
+                bound_params,
+                strict,
+                auth_token_ttl=self.__auth_token_ttl,
+                validate_inputs=self.__validate_inputs,
+            )
+            for tool_name, manifest in zip(tool_names, manifests)
+        ]
+
     async def aload_toolset(
         self,
         toolset_name: Optional[str] = None,
@@ -132,8 +245,11 @@ class AsyncToolboxClient:
                 )
                 auth_tokens = auth_headers
 
-        url = f"{self.__url}/api/toolset/{toolset_name or ''}"
-        manifest: ManifestSchema = await _load_manifest(url, self.__session)
+        url = self.__toolset_endpoint + (toolset_name or "")
+        manifest: ManifestSchema = await self.__load_manifest(url)
+        if not manifest.tools:
+            return []
+
         tools: list[AsyncToolboxTool] = []
 
         for tool_name, tool_schema in manifest.tools.items():
@@ -146,6 +262,8 @@ class AsyncToolboxClient:
                     auth_tokens,
                     bound_params,
                     strict,
+                    auth_token_ttl=self.__auth_token_ttl,
+                    validate_inputs=self.__validate_inputs,
                 )
             )
         return tools
@@ -160,6 +278,16 @@ class AsyncToolboxClient:
     ) -> AsyncToolboxTool:
         raise NotImplementedError("Synchronous methods not supported by async client.")
 
+    def load_tools(
+        self,
+        tool_names: list[str],
+        auth_tokens: dict[str, Callable[[], str]] = {},
+        auth_headers: Optional[dict[str, Callable[[], str]]] = None,
+        bound_params: dict[str, Union[Any, Callable[[], Any]]] = {},
+        strict: bool = True,
+    ) -> list[AsyncToolboxTool]:
+        raise NotImplementedError("Synchronous methods not supported by async client.")
+
     def load_toolset(
         self,
         toolset_name: Optional[str] = None,
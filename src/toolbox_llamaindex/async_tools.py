@@ -12,8 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from copy import deepcopy
-from typing import Any, Callable, TypeVar, Union
+from typing import Any, Callable, Optional, TypeVar, Union
 from warnings import warn
 
 from aiohttp import ClientResponseError, ClientSession
@@ -22,8 +21,10 @@ from llama_index.core.tools.types import AsyncBaseTool, ToolOutput
 
 from .utils import (
     ToolSchema,
+    _cache_id_token_getter,
     _find_auth_params,
     _find_bound_params,
+    _get_auth_tokens,
     _invoke_tool,
     _schema_to_model,
 )
@@ -46,9 +47,11 @@ class AsyncToolboxTool(AsyncBaseTool):
         schema: ToolSchema,
         url: str,
         session: ClientSession,
-        auth_tokens: dict[str, Callable[[], str]] = {},
-        bound_params: dict[str, Union[Any, Callable[[], Any]]] = {},
+        auth_tokens: Optional[dict[str, Callable[[], str]]] = None,
+        bound_params: Optional[dict[str, Union[Any, Callable[[], Any]]]] = None,
         strict: bool = True,
+        auth_token_ttl: float = 0,
+        validate_inputs: bool = True,
     ) -> None:
         """
         Initializes an AsyncToolboxTool instance.
@@ -65,6 +68,14 @@ class AsyncToolboxTool(AsyncBaseTool):
             strict: If True, raises a ValueError if any of the given bound
                 parameters are missing from the schema or require
                 authentication. If False, only issues a warning.
+            auth_token_ttl: The number of seconds an ID token retrieved from
+                `auth_tokens` is reused across invocations before it is
+                retrieved again. Tokens are retrieved on every invocation by
+                default.
+            validate_inputs: If True, validates the arguments of each
+                invocation against the tool schema before invoking the tool.
+                Set to False if the arguments are already validated by the
+                caller.
         """
 
         # If the schema is not already a ToolSchema instance, we create one from
@@ -74,19 +85,24 @@ class AsyncToolboxTool(AsyncBaseTool):
         if not isinstance(schema, ToolSchema):
             schema = ToolSchema(**schema)
 
+        auth_tokens = auth_tokens or {}
+        bound_params = bound_params or {}
+
         auth_params, non_auth_params = _find_auth_params(schema.parameters)
         non_auth_bound_params, non_auth_non_bound_params = _find_bound_params(
             non_auth_params, list(bound_params)
         )
+        auth_names = frozenset(param.name for param in auth_params)
+        non_auth_names = frozenset(param.name for param in non_auth_params)
 
         # Check if the user is trying to bind a param that is authenticated or
         # is missing from the given schema.
         auth_bound_params: list[str] = []
         missing_bound_params: list[str] = []
         for bound_param in bound_params:
-            if bound_param in [param.name for param in auth_params]:
+            if bound_param in auth_names:
                 auth_bound_params.append(bound_param)
-            elif bound_param not in [param.name for param in non_auth_params]:
+            elif bound_param not in non_auth_names:
                 missing_bound_params.append(bound_param)
 
         # Create error messages for any params that are found to be
@@ -111,15 +127,17 @@ class AsyncToolboxTool(AsyncBaseTool):
 
         # Bind values for parameters present in the schema that don't require
         # authentication.
-        bound_params = {
-            param_name: param_value
-            for param_name, param_value in bound_params.items()
-            if param_name in [param.name for param in non_auth_bound_params]
+        filtered_bound_params = {
+            param.name: bound_params[param.name] for param in non_auth_bound_params
         }
 
         # Update the tools schema to validate only the presence of parameters
-        # that neither require authentication nor are bound.
-        schema.parameters = non_auth_non_bound_params
+        # that neither require authentication nor are bound. A new schema is
+        # created so that the given schema, which may be shared with other
+        # tools, is left untouched.
+        schema = ToolSchema(
+            description=schema.description, parameters=non_auth_non_bound_params
+        )
 
         # Due to how pydantic works, we must initialize the underlying
         # AsyncBaseTool class before assigning values to member variables.
@@ -127,24 +145,58 @@ class AsyncToolboxTool(AsyncBaseTool):
         self.__name = name
         self.__schema = schema
         self.__url = url
+        self.__invoke_url = f"{url}/api/tool/{name}/invoke"
         self.__session = session
         self.__auth_tokens = auth_tokens
+        self.__auth_token_ttl = auth_token_ttl
+        self.__id_token_getters = auth_tokens
+        if auth_token_ttl > 0:
+            self.__id_token_getters = {
+                auth_source: _cache_id_token_getter(get_id_token, auth_token_ttl)
+                for auth_source, get_id_token in auth_tokens.items()
+            }
         self.__auth_params = auth_params
-        self.__bound_params = bound_params
+        self.__auth_param_sources = [
+            (param.name, frozenset(param.authSources or ())) for param in auth_params
+        ]
+        self.__needs_auth_validation = bool(auth_params)
+        self.__bound_params = filtered_bound_params
+        self.__static_bound_params = {
+            param_name: param_value
+            for param_name, param_value in filtered_bound_params.items()
+            if not callable(param_value)
+        }
+        self.__callable_bound_params = {
+            param_name: param_value
+            for param_name, param_value in filtered_bound_params.items()
+            if callable(param_value)
+        }
+        self.__validate_inputs = validate_inputs
+
+        # The parameter schema is fixed for the lifetime of the tool, so its
+        # model is created once here rather than on every metadata access.
+        self.__metadata = ToolMetadata(
+            name=name,
+            description=schema.description,
+            fn_schema=_schema_to_model(model_name=name, schema=schema.parameters),
+        )
+
+        # ID tokens contain sensitive user information (claims). Transmitting these
+        # over HTTP exposes the data to interception and unauthorized access. Always
+        # use HTTPS to ensure secure communication and protect user privacy.
+        if auth_tokens and not url.startswith("https://"):
+            warn(
+                "Sending ID token over HTTP. User data may be exposed. Use HTTPS for secure communication."
+            )
 
         # Warn users about any missing authentication so they can add it before
         # tool invocation.
-        self.__validate_auth(strict=False)
+        if self.__needs_auth_validation:
+            self.__validate_auth(strict=False)
 
     @property
     def metadata(self) -> ToolMetadata:
-        return ToolMetadata(
-            name=self.__name,
-            description=self.__schema.description,
-            fn_schema=_schema_to_model(
-                model_name=self.__name, schema=self.__schema.parameters
-            ),
-        )
+        return self.__metadata
 
     def call(self, *args: Any, **kwargs: Any) -> ToolOutput:  # type: ignore
         raise NotImplementedError("Synchronous methods not supported by async tools.")
@@ -160,28 +212,28 @@ class AsyncToolboxTool(AsyncBaseTool):
             A dictionary containing the parsed JSON response from the tool
             invocation.
         """
-        # Validate arguments with the schema
-        if self.metadata.fn_schema:
-            self.metadata.fn_schema.model_validate(kwargs)
+        # Validate arguments with the schema. This is done before the bound
+        # parameters are merged in, so only the caller's arguments are checked.
+        if self.__validate_inputs and self.__metadata.fn_schema:
+            self.__metadata.fn_schema.model_validate(kwargs)
 
         # If the tool had parameters that require authentication, then right
         # before invoking that tool, we check whether all these required
         # authentication sources have been registered or not.
-        self.__validate_auth()
-
-        # Evaluate dynamic parameter values if any
-        evaluated_params = {}
-        for param_name, param_value in self.__bound_params.items():
-            if callable(param_value):
-                evaluated_params[param_name] = param_value()
-            else:
-                evaluated_params[param_name] = param_value
-
-        # Merge bound parameters with the provided arguments
-        kwargs.update(evaluated_params)
+        if self.__needs_auth_validation:
+            self.__validate_auth()
+
+        # Merge bound parameters with the provided arguments, evaluating
+        # dynamic parameter values if any
+        kwargs.update(self.__static_bound_params)
+        for param_name, get_param_value in self.__callable_bound_params.items():
+            kwargs[param_name] = get_param_value()
         try:
             response = await _invoke_tool(
-                self.__url, self.__session, self.__name, kwargs, self.__auth_tokens
+                self.__invoke_url,
+                self.__session,
+                kwargs,
+                _get_auth_tokens(self.__id_token_getters),
             )
             return ToolOutput(
                 content=str(response),
@@ -218,21 +270,13 @@ class AsyncToolboxTool(AsyncBaseTool):
             PermissionError: If strict is True and any required authentication
                 sources are not registered.
         """
-        params_missing_auth: list[str] = []
-
         # Check each parameter for at least 1 required auth source
-        for param in self.__auth_params:
-            if not param.authSources:
-                raise ValueError("Auth sources cannot be None.")
-            has_auth = False
-            for src in param.authSources:
-
-                # Find first auth source that is specified
-                if src in self.__auth_tokens:
-                    has_auth = True
-                    break
-            if not has_auth:
-                params_missing_auth.append(param.name)
+        auth_sources = self.__auth_tokens.keys()
+        params_missing_auth = [
+            param_name
+            for param_name, param_auth_sources in self.__auth_param_sources
+            if param_auth_sources.isdisjoint(auth_sources)
+        ]
 
         if params_missing_auth:
             message = f"Parameter(s) `{', '.join(params_missing_auth)}` of tool {self.__name} require authentication, but no valid authentication sources are registered. Please register the required sources before use."
@@ -244,8 +288,8 @@ class AsyncToolboxTool(AsyncBaseTool):
     def __create_copy(
         self,
         *,
-        auth_tokens: dict[str, Callable[[], str]] = {},
-        bound_params: dict[str, Union[Any, Callable[[], Any]]] = {},
+        auth_tokens: Optional[dict[str, Callable[[], str]]] = None,
+        bound_params: Optional[dict[str, Union[Any, Callable[[], Any]]]] = None,
         strict: bool,
     ) -> "AsyncToolboxTool":
         """
@@ -270,26 +314,31 @@ class AsyncToolboxTool(AsyncBaseTool):
                 authentication. If False, only issues a warning.
 
         Returns:
-            A new AsyncToolboxTool instance that is a deep copy of the current
-            instance, with added auth tokens or bound params.
+            A new AsyncToolboxTool instance that shares the current
+            instance's parameter schemas, with added auth tokens or bound params.
         """
-        new_schema = deepcopy(self.__schema)
-
         # Reconstruct the complete parameter schema by merging the auth
         # parameters back with the non-auth parameters. This is necessary to
         # accurately validate the new combination of auth tokens and bound
         # params in the constructor of the new AsyncToolboxTool instance, ensuring
         # that any overlaps or conflicts are correctly identified and reported
-        # as errors or warnings, depending on the given `strict` flag.
-        new_schema.parameters += self.__auth_params
+        # as errors or warnings, depending on the given `strict` flag. The
+        # parameter schemas are never modified, so they are shared with the new
+        # instance rather than deep copied.
+        new_schema = ToolSchema(
+            description=self.__schema.description,
+            parameters=[*self.__schema.parameters, *self.__auth_params],
+        )
         return AsyncToolboxTool(
             name=self.__name,
             schema=new_schema,
             url=self.__url,
             session=self.__session,
-            auth_tokens={**self.__auth_tokens, **auth_tokens},
-            bound_params={**self.__bound_params, **bound_params},
+            auth_tokens={**self.__auth_tokens, **(auth_tokens or {})},
+            bound_params={**self.__bound_params, **(bound_params or {})},
             strict=strict,
+            auth_token_ttl=self.__auth_token_ttl,
+            validate_inputs=self.__validate_inputs,
         )
 
     def add_auth_tokens(
@@ -306,8 +355,8 @@ class AsyncToolboxTool(AsyncBaseTool):
                 tokens are already bound. If False, only a warning is issued.
 
         Returns:
-            A new AsyncToolboxTool instance that is a deep copy of the current
-            instance, with added auth tokens.
+            A new AsyncToolboxTool instance that shares the current
+            instance's parameter schemas, with added auth tokens.
 
         Raises:
             ValueError: If the provided auth tokens are already registered.
@@ -316,10 +365,7 @@ class AsyncToolboxTool(AsyncBaseTool):
         """
 
         # Check if the authentication source is already registered.
-        dupe_tokens: list[str] = []
-        for auth_token, _ in auth_tokens.items():
-            if auth_token in self.__auth_tokens:
-                dupe_tokens.append(auth_token)
+        dupe_tokens = sorted(auth_tokens.keys() & self.__auth_tokens.keys())
 
         if dupe_tokens:
             raise ValueError(
@@ -342,8 +388,8 @@ class AsyncToolboxTool(AsyncBaseTool):
                 token is already bound. If False, only a warning is issued.
 
         Returns:
-            A new ToolboxTool instance that is a deep copy of the current
-            instance, with added auth token.
+            A new ToolboxTool instance that shares the current
+            instance's parameter schemas, with added auth token.
 
         Raises:
             ValueError: If the provided auth token is already registered.
@@ -369,8 +415,8 @@ class AsyncToolboxTool(AsyncBaseTool):
                 authentication. If False, only a warning is issued.
 
         Returns:
-            A new AsyncToolboxTool instance that is a deep copy of the current
-            instance, with added bound params.
+            A new AsyncToolboxTool instance that shares the current
+            instance's parameter schemas, with added bound params.
 
         Raises:
             ValueError: If the provided bound params are already bound.
@@ -379,10 +425,7 @@ class AsyncToolboxTool(AsyncBaseTool):
         """
 
         # Check if the parameter is already bound.
-        dupe_params: list[str] = []
-        for param_name, _ in bound_params.items():
-            if param_name in self.__bound_params:
-                dupe_params.append(param_name)
+        dupe_params = sorted(bound_params.keys() & self.__bound_params.keys())
 
         if dupe_params:
             raise ValueError(
@@ -410,8 +453,8 @@ class AsyncToolboxTool(AsyncBaseTool):
                 authentication. If False, only a warning is issued.
 
         Returns:
-            A new ToolboxTool instance that is a deep copy of the current
-            instance, with added bound param.
+            A new ToolboxTool instance that shares the current
+            instance's parameter schemas, with added bound param.
 
         Raises:
             ValueError: If the provided bound param is already bound.
@@ -16,7 +16,7 @@ import asyncio
 from threading import Thread
 from typing import Any, Awaitable, Callable, Optional, TypeVar, Union
 
-from aiohttp import ClientSession
+from aiohttp import ClientSession, TCPConnector
 
 from .async_client import AsyncToolboxClient
 from .tools import ToolboxTool
@@ -32,12 +32,26 @@ class ToolboxClient:
     def __init__(
         self,
         url: str,
+        manifest_cache_ttl: float = 0,
+        auth_token_ttl: float = 0,
+        validate_inputs: bool = True,
     ) -> None:
         """
         Initializes the ToolboxClient for the Toolbox service at the given URL.
 
         Args:
             url: The base URL of the Toolbox service.
+            manifest_cache_ttl: The number of seconds a fetched manifest is
+                reused before it is requested again. Caching is disabled by
+                default.
+            auth_token_ttl: The number of seconds an ID token retrieved from
+                the `auth_tokens` of a loaded tool is reused across invocations
+                before it is retrieved again. Tokens are retrieved on every
+                invocation by default.
+            validate_inputs: If True, loaded tools validate the arguments of
+                each invocation against the tool schema before invoking the
+                tool. Set to False if the arguments are already validated by
+                the caller.
         """
 
         # Running a loop in a background thread allows us to support async
@@ -53,9 +67,18 @@ class ToolboxClient:
 
             # Use a default session if none is provided. This leverages connection
             # pooling for better performance by reusing a single session throughout
-            # the application's lifetime.
+            # the application's lifetime. Idle connections are kept alive and DNS
+            # results are cached so that repeated tool loads and invocations skip
+            # the TCP/TLS handshake and name resolution.
             if ToolboxClient.__session is None:
-                ToolboxClient.__session = ClientSession()
+                ToolboxClient.__session = ClientSession(
+                    connector=TCPConnector(
+                        limit=100,
+                        limit_per_host=32,
+                        ttl_dns_cache=300,
+                        keepalive_timeout=60,
+                    )
+                )
 
         coro = __start_session()
 
@@ -63,7 +86,13 @@ class ToolboxClient:
 
         if not ToolboxClient.__session:
             raise ValueError("Session cannot be None.")
-        self.__async_client = AsyncToolboxClient(url, ToolboxClient.__session)
+        self.__async_client = AsyncToolboxClient(
+            url,
+            ToolboxClient.__session,
+            manifest_cache_ttl=manifest_cache_ttl,
+            auth_token_ttl=auth_token_ttl,
+            validate_inputs=validate_inputs,
+        )
 
     def __run_as_sync(self, coro: Awaitable[T]) -> T:
         """Run an async coroutine synchronously"""
@@ -120,6 +149,44 @@ class ToolboxClient:
             raise ValueError("Background loop or thread cannot be None.")
         return ToolboxTool(async_tool, self.__loop, self.__thread)
 
+    async def aload_tools(
+        self,
+        tool_names: list[str],
+        auth_tokens: dict[str, Callable[[], str]] = {},
+        auth_headers: Optional[dict[str, Callable[[], str]]] = None,
+        bound_params: dict[str, Union[Any, Callable[[], Any]]] = {},
+        strict: bool = True,
+    ) -> list[ToolboxTool]:
+        """
+        Loads the tools with the given tool names from the Toolbox service.
+
+        Args:
+            tool_names: The names of the tools to load.
+            auth_tokens: An optional mapping of authentication source names to
+                functions that retrieve ID tokens.
+            auth_headers: Deprecated. Use `auth_tokens` instead.
+            bound_params: An optional mapping of parameter names to their
+                bound values.
+            strict: If True, raises a ValueError if any of the given bound
+                parameters are missing from the schema or require
+                authentication. If False, only issues a warning.
+
+        Returns:
+            A list of tools loaded from the Toolbox.
+        """
+        async_tools = await self.__run_as_async(
+            self.__async_client.aload_tools(
+                tool_names, auth_tokens, auth_headers, bound_params, strict
+            )
+        )
+
+        if not self.__loop or not self.__thread:
+            raise ValueError("Background loop or thread cannot be None.")
+        return [
+            ToolboxTool(async_tool, self.__loop, self.__thread)
+            for async_tool in async_tools
+        ]
+
     async def aload_toolset(
         self,
         toolset_name: Optional[str] = None,
@@ -196,6 +263,44 @@ class ToolboxClient:
             raise ValueError("Background loop or thread cannot be None.")
         return ToolboxTool(async_tool, self.__loop, self.__thread)
 
+    def load_tools(
+        self,
+        tool_names: list[str],
+        auth_tokens: dict[str, Callable[[], str]] = {},
+        auth_headers: Optional[dict[str, Callable[[], str]]] = None,
+        bound_params: dict[str, Union[Any, Callable[[], Any]]] = {},
+        strict: bool = True,
+    ) -> list[ToolboxTool]:
+        """
+        Loads the tools with the given tool names from the Toolbox service.
+
+        Args:
+            tool_names: The names of the tools to load.
+            auth_tokens: An optional mapping of authentication source names to
+                functions that retrieve ID tokens.
+            auth_headers: Deprecated. Use `auth_tokens` instead.
+            bound_params: An optional mapping of parameter names to their
+                bound values.
+            strict: If True, raises a ValueError if any of the given bound
+                parameters are missing from the schema or require
+                authentication. If False, only issues a warning.
+
+        Returns:
+            A list of tools loaded from the Toolbox.
+        """
+        async_tools = self.__run_as_sync(
+            self.__async_client.aload_tools(
+                tool_names, auth_tokens, auth_headers, bound_params, strict
+            )
+        )
+
+        if not self.__loop or not self.__thread:
+            raise ValueError("Background loop or thread cannot be None.")
+        return [
+            ToolboxTool(async_tool, self.__loop, self.__thread)
+            for async_tool in async_tools
+        ]
+
     def load_toolset(
         self,
         toolset_name: Optional[str] = None,
@@ -103,8 +103,8 @@ class ToolboxTool(AsyncBaseTool):
                 tokens are already bound. If False, only a warning is issued.
 
         Returns:
-            A new ToolboxTool instance that is a deep copy of the current
-            instance, with added auth tokens.
+            A new ToolboxTool instance that shares the current
+            instance's parameter schemas, with added auth tokens.
 
         Raises:
             ValueError: If the provided auth tokens are already registered.
@@ -131,8 +131,8 @@ class ToolboxTool(AsyncBaseTool):
                 token is already bound. If False, only a warning is issued.
 
         Returns:
-            A new ToolboxTool instance that is a deep copy of the current
-            instance, with added auth token.
+            A new ToolboxTool instance that shares the current
+            instance's parameter schemas, with added auth token.
 
         Raises:
             ValueError: If the provided auth token is already registered.
@@ -162,8 +162,8 @@ class ToolboxTool(AsyncBaseTool):
                 authentication. If False, only a warning is issued.
 
         Returns:
-            A new ToolboxTool instance that is a deep copy of the current
-            instance, with added bound params.
+            A new ToolboxTool instance that shares the current
+            instance's parameter schemas, with added bound params.
 
         Raises:
             ValueError: If the provided bound params are already bound.
@@ -195,8 +195,8 @@ class ToolboxTool(AsyncBaseTool):
                 authentication. If False, only a warning is issued.
 
         Returns:
-            A new ToolboxTool instance that is a deep copy of the current
-            instance, with added bound param.
+            A new ToolboxTool instance that shares the current
+            instance's parameter schemas, with added bound param.
 
         Raises:
             ValueError: If the provided bound param is already bound.
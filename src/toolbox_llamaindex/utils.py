@@ -13,12 +13,21 @@
 # limitations under the License.
 
 import json
-from typing import Any, Callable, Optional, Type, cast
-from warnings import warn
+import sys
+import time
+from functools import cache, lru_cache
+from typing import Any, Callable, Hashable, Optional, Type, cast
 
 from aiohttp import ClientSession
 from deprecated import deprecated
-from pydantic import BaseModel, Field, create_model
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationError,
+    create_model,
+    field_validator,
+)
 
 
 class ParameterSchema(BaseModel):
@@ -26,12 +35,24 @@ class ParameterSchema(BaseModel):
     Schema for a tool parameter.
     """
 
+    # Parameter schemas are shared between tool instances, so they must not be
+    # modified after they are parsed.
+    model_config = ConfigDict(frozen=True)
+
     name: str
     type: str
     description: str
     authSources: Optional[list[str]] = None
     items: Optional["ParameterSchema"] = None
 
+    @field_validator("name")
+    @classmethod
+    def _intern_name(cls, name: str) -> str:
+        # Parameter names are repeatedly used as dict keys and compared against
+        # bound param and auth token names, so intern them to make those
+        # lookups cheaper.
+        return sys.intern(name)
+
 
 class ToolSchema(BaseModel):
     """
@@ -67,19 +88,26 @@ async def _load_manifest(url: str, session: ClientSession) -> ManifestSchema:
         json.JSONDecodeError: If the response is not valid JSON.
         ValueError: If the response is not a valid manifest.
     """
-    async with session.get(url) as response:
+    async with session.get(url, headers={"Accept": "application/json"}) as response:
         # TODO: Remove as it masks error messages.
         response.raise_for_status()
+        body = await response.read()
         try:
-            # TODO: Simply use response.json()
-            parsed_json = json.loads(await response.text())
-        except json.JSONDecodeError as e:
-            raise json.JSONDecodeError(
-                f"Failed to parse JSON from {url}: {e}", e.doc, e.pos
-            ) from e
-        try:
-            return ManifestSchema(**parsed_json)
-        except ValueError as e:
+            # Parse and validate the manifest in a single pass, without first
+            # building an intermediate tree of Python dicts and lists.
+            return ManifestSchema.model_validate_json(body)
+        except ValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                # Parse the body again with the json module so callers get a
+                # JSONDecodeError pointing at the malformed input.
+                try:
+                    json.loads(body)
+                except json.JSONDecodeError as json_error:
+                    raise json.JSONDecodeError(
+                        f"Failed to parse JSON from {url}: {json_error}",
+                        json_error.doc,
+                        json_error.pos,
+                    ) from json_error
             raise ValueError(f"Invalid JSON data from {url}: {e}") from e
 
 
@@ -87,26 +115,59 @@ def _schema_to_model(model_name: str, schema: list[ParameterSchema]) -> Type[Bas
     """
     Converts the given manifest schema to a Pydantic BaseModel class.
 
+    Models are cached by name and field definitions, so converting an
+    identical schema again returns the previously created class.
+
     Args:
         model_name: The name of the model to create.
         schema: The schema to convert.
 
+    Returns:
+        A Pydantic BaseModel class.
+    """
+    schema_key = tuple(
+        (field.name, _parse_type(field), field.description) for field in schema
+    )
+    return _schema_key_to_model(model_name, schema_key)
+
+
+@lru_cache(maxsize=512)
+def _schema_key_to_model(
+    model_name: str, schema_key: tuple[tuple[str, Hashable, str], ...]
+) -> Type[BaseModel]:
+    """
+    Creates a Pydantic BaseModel class from hashable field definitions.
+
+    Args:
+        model_name: The name of the model to create.
+        schema_key: A tuple of (name, type, description) for each field.
+
     Returns:
         A Pydantic BaseModel class.
     """
     field_definitions = {}
-    for field in schema:
-        field_definitions[field.name] = cast(
+    for field_name, field_type, field_description in schema_key:
+        field_definitions[field_name] = cast(
             Any,
             (
-                _parse_type(field),
-                Field(description=field.description),
+                field_type,
+                Field(description=field_description),
             ),
         )
 
     return create_model(model_name, **field_definitions)
 
 
+# Maps the scalar schema types to their Python types. Arrays are handled
+# separately in `_parse_type` as their element type must be resolved as well.
+_TYPE_MAP: dict[str, type] = {
+    "string": str,
+    "integer": int,
+    "float": float,
+    "boolean": bool,
+}
+
+
 def _parse_type(schema_: ParameterSchema) -> Any:
     """
     Converts a schema type to a JSON type.
@@ -122,21 +183,30 @@ def _parse_type(schema_: ParameterSchema) -> Any:
     """
     type_ = schema_.type
 
-    if type_ == "string":
-        return str
-    elif type_ == "integer":
-        return int
-    elif type_ == "float":
-        return float
-    elif type_ == "boolean":
-        return bool
-    elif type_ == "array":
+    if type_ == "array":
         if isinstance(schema_, ParameterSchema) and schema_.items:
-            return list[_parse_type(schema_.items)]  # type: ignore
+            return _list_type(_parse_type(schema_.items))
         else:
             raise ValueError(f"Schema missing field items")
-    else:
-        raise ValueError(f"Unsupported schema type: {type_}")
+    try:
+        return _TYPE_MAP[type_]
+    except KeyError:
+        raise ValueError(f"Unsupported schema type: {type_}") from None
+
+
+@cache
+def _list_type(item_type: Any) -> Any:
+    """
+    Returns the list type for the given element type, reusing the same type
+    object for every array parameter with that element type.
+
+    Args:
+        item_type: The type of the list elements.
+
+    Returns:
+        A `list[item_type]` type.
+    """
+    return list[item_type]  # type: ignore
 
 
 @deprecated("Please use `_get_auth_tokens` instead.")
@@ -165,41 +235,58 @@ def _get_auth_tokens(id_token_getters: dict[str, Callable[[], str]]) -> dict[str
     return auth_tokens
 
 
+def _cache_id_token_getter(
+    get_id_token: Callable[[], str], ttl: float
+) -> Callable[[], str]:
+    """
+    Wraps an ID token getter so that the token it returns is reused until the
+    given time-to-live has elapsed.
+
+    Args:
+        get_id_token: The function that returns an ID token.
+        ttl: The number of seconds a retrieved ID token is reused for.
+
+    Returns:
+        A function that returns the cached ID token, retrieving a new one from
+        the wrapped function once the cached token has expired.
+    """
+    token: Optional[str] = None
+    expiry = 0.0
+
+    def cached_get_id_token() -> str:
+        nonlocal token, expiry
+        now = time.monotonic()
+        if token is None or now >= expiry:
+            token = get_id_token()
+            expiry = now + ttl
+        return token
+
+    return cached_get_id_token
+
+
 async def _invoke_tool(
-    url: str,
+    invoke_url: str,
     session: ClientSession,
-    tool_name: str,
     data: dict,
-    id_token_getters: dict[str, Callable[[], str]],
+    auth_tokens: dict[str, str],
 ) -> dict:
     """
     Asynchronously makes an API call to the Toolbox service to invoke a tool.
 
     Args:
-        url: The base URL of the Toolbox service.
+        invoke_url: The invocation URL of the tool, i.e.
+            `{url}/api/tool/{tool_name}/invoke`.
         session: The HTTP client session.
-        tool_name: The name of the tool to invoke.
         data: The input data for the tool.
-        id_token_getters: A dict that maps auth source names to the functions
-            that return its ID token.
+        auth_tokens: The tokens to be included in the tool invocation, as
+            returned by `_get_auth_tokens`.
 
     Returns:
         A dictionary containing the parsed JSON response from the tool
         invocation.
     """
-    url = f"{url}/api/tool/{tool_name}/invoke"
-    auth_tokens = _get_auth_tokens(id_token_getters)
-
-    # ID tokens contain sensitive user information (claims). Transmitting these
-    # over HTTP exposes the data to interception and unauthorized access. Always
-    # use HTTPS to ensure secure communication and protect user privacy.
-    if auth_tokens and not url.startswith("https://"):
-        warn(
-            "Sending ID token over HTTP. User data may be exposed. Use HTTPS for secure communication."
-        )
-
     async with session.post(
-        url,
+        invoke_url,
         json=data,
         headers=auth_tokens,
     ) as response:
@@ -253,8 +340,10 @@ def _find_bound_params(
     _bound_params: list[ParameterSchema] = []
     _non_bound_params: list[ParameterSchema] = []
 
+    # Use a set so that each membership check is constant time.
+    bound_param_names = set(bound_params)
     for param in params:
-        if param.name in bound_params:
+        if param.name in bound_param_names:
             _bound_params.append(param)
         else:
             _non_bound_params.append(param)
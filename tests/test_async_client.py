@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import asyncio
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from warnings import catch_warnings, simplefilter
 
 import pytest
@@ -83,6 +83,73 @@ class TestAsyncToolboxClient:
         assert isinstance(tool, AsyncToolboxTool)
         assert tool._AsyncToolboxTool__name == tool_name
 
+    @patch("toolbox_llamaindex.async_client._load_manifest")
+    async def test_aload_tool_manifest_not_cached_by_default(
+        self, mock_load_manifest, mock_client, manifest_schema
+    ):
+        mock_load_manifest.return_value = manifest_schema
+
+        await mock_client.aload_tool("test_tool_1")
+        await mock_client.aload_tool("test_tool_1")
+
+        assert mock_load_manifest.call_count == 2
+
+    @patch("toolbox_llamaindex.async_client.time.monotonic")
+    @patch("toolbox_llamaindex.async_client._load_manifest")
+    async def test_aload_tool_manifest_cached(
+        self, mock_load_manifest, mock_monotonic, mock_session, manifest_schema
+    ):
+        mock_load_manifest.return_value = manifest_schema
+        mock_monotonic.return_value = 100.0
+        client = AsyncToolboxClient(URL, session=mock_session, manifest_cache_ttl=10)
+
+        await client.aload_tool("test_tool_1")
+        mock_monotonic.return_value = 105.0
+        tool = await client.aload_tool("test_tool_1")
+
+        mock_load_manifest.assert_called_once_with(
+            f"{URL}/api/tool/test_tool_1", mock_session
+        )
+        assert tool._AsyncToolboxTool__name == "test_tool_1"
+
+        mock_monotonic.return_value = 111.0
+        await client.aload_tool("test_tool_1")
+        assert mock_load_manifest.call_count == 2
+
+    @patch("toolbox_llamaindex.async_client._load_manifest")
+    async def test_aload_tool_auth_token_ttl(
+        self, mock_load_manifest, mock_session, manifest_schema
+    ):
+        mock_load_manifest.return_value = manifest_schema
+        client = AsyncToolboxClient(URL, session=mock_session, auth_token_ttl=30)
+
+        tool = await client.aload_tool("test_tool_1")
+
+        assert tool._AsyncToolboxTool__auth_token_ttl == 30
+
+    @patch("toolbox_llamaindex.async_client._load_manifest")
+    async def test_aload_tool_validate_inputs_disabled(
+        self, mock_load_manifest, mock_session, manifest_schema
+    ):
+        mock_load_manifest.return_value = manifest_schema
+        mock_session.post.return_value.__aenter__.return_value.raise_for_status = Mock()
+        mock_session.post.return_value.__aenter__.return_value.json = AsyncMock(
+            return_value={"result": "test-result"}
+        )
+        client = AsyncToolboxClient(URL, session=mock_session, validate_inputs=False)
+
+        tool = await client.aload_tool("test_tool_1")
+        with patch.object(tool.metadata.fn_schema, "model_validate") as mock_validate:
+            result = await tool.acall(param1=123)
+
+        mock_validate.assert_not_called()
+        assert result.content == str({"result": "test-result"})
+        mock_session.post.assert_called_once_with(
+            f"{URL}/api/tool/test_tool_1/invoke",
+            json={"param1": 123},
+            headers={},
+        )
+
     @patch("toolbox_llamaindex.async_client._load_manifest")
     async def test_aload_tool_auth_headers_deprecated(
         self, mock_load_manifest, mock_client, manifest_schema
@@ -95,9 +162,13 @@ class TestAsyncToolboxClient:
             await mock_client.aload_tool(
                 tool_name, auth_headers={"Authorization": lambda: "Bearer token"}
             )
-            assert len(w) == 1
-            assert issubclass(w[-1].category, DeprecationWarning)
-            assert "auth_headers" in str(w[-1].message)
+            deprecation_warnings = [
+                warning
+                for warning in w
+                if issubclass(warning.category, DeprecationWarning)
+            ]
+            assert len(deprecation_warnings) == 1
+            assert "auth_headers" in str(deprecation_warnings[-1].message)
 
     @patch("toolbox_llamaindex.async_client._load_manifest")
     async def test_aload_tool_auth_headers_and_tokens(
@@ -113,9 +184,51 @@ class TestAsyncToolboxClient:
                 auth_headers={"Authorization": lambda: "Bearer token"},
                 auth_tokens={"test": lambda: "token"},
             )
-            assert len(w) == 1
-            assert issubclass(w[-1].category, DeprecationWarning)
-            assert "auth_headers" in str(w[-1].message)
+            deprecation_warnings = [
+                warning
+                for warning in w
+                if issubclass(warning.category, DeprecationWarning)
+            ]
+            assert len(deprecation_warnings) == 1
+            assert "auth_headers" in str(deprecation_warnings[-1].message)
+
+    @patch("toolbox_llamaindex.async_client._load_manifest")
+    async def test_aload_tools(
+        self, mock_load_manifest, mock_client, mock_session, manifest_schema
+    ):
+        tool_names = ["test_tool_1", "test_tool_2"]
+        mock_load_manifest.return_value = manifest_schema
+
+        tools = await mock_client.aload_tools(tool_names)
+
+        assert mock_load_manifest.call_count == 2
+        mock_load_manifest.assert_any_call(f"{URL}/api/tool/test_tool_1", mock_session)
+        mock_load_manifest.assert_any_call(f"{URL}/api/tool/test_tool_2", mock_session)
+        assert len(tools) == 2
+        for tool, tool_name in zip(tools, tool_names):
+            assert isinstance(tool, AsyncToolboxTool)
+            assert tool._AsyncToolboxTool__name == tool_name
+
+    @patch("toolbox_llamaindex.async_client._load_manifest")
+    async def test_aload_tools_concurrent(
+        self, mock_load_manifest, mock_client, manifest_schema
+    ):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def load_manifest(url, session):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return manifest_schema
+
+        mock_load_manifest.side_effect = load_manifest
+
+        await mock_client.aload_tools(["test_tool_1", "test_tool_2"])
+
+        assert max_in_flight == 2
 
     @patch("toolbox_llamaindex.async_client._load_manifest")
     async def test_aload_toolset(
@@ -131,6 +244,14 @@ class TestAsyncToolboxClient:
             assert isinstance(tool, AsyncToolboxTool)
             assert tool._AsyncToolboxTool__name in ["test_tool_1", "test_tool_2"]
 
+    @patch("toolbox_llamaindex.async_client._load_manifest")
+    async def test_aload_toolset_empty(self, mock_load_manifest, mock_client):
+        mock_load_manifest.return_value = ManifestSchema(
+            serverVersion="1.0.0", tools={}
+        )
+        tools = await mock_client.aload_toolset()
+        assert tools == []
+
     @patch("toolbox_llamaindex.async_client._load_manifest")
     async def test_aload_toolset_with_toolset_name(
         self, mock_load_manifest, mock_client, mock_session, manifest_schema
@@ -159,9 +280,13 @@ class TestAsyncToolboxClient:
             await mock_client.aload_toolset(
                 auth_headers={"Authorization": lambda: "Bearer token"}
             )
-            assert len(w) == 1
-            assert issubclass(w[-1].category, DeprecationWarning)
-            assert "auth_headers" in str(w[-1].message)
+            deprecation_warnings = [
+                warning
+                for warning in w
+                if issubclass(warning.category, DeprecationWarning)
+            ]
+            assert len(deprecation_warnings) == 1
+            assert "auth_headers" in str(deprecation_warnings[-1].message)
 
     @patch("toolbox_llamaindex.async_client._load_manifest")
     async def test_aload_toolset_auth_headers_and_tokens(
@@ -175,9 +300,13 @@ class TestAsyncToolboxClient:
                 auth_headers={"Authorization": lambda: "Bearer token"},
                 auth_tokens={"test": lambda: "token"},
             )
-            assert len(w) == 1
-            assert issubclass(w[-1].category, DeprecationWarning)
-            assert "auth_headers" in str(w[-1].message)
+            deprecation_warnings = [
+                warning
+                for warning in w
+                if issubclass(warning.category, DeprecationWarning)
+            ]
+            assert len(deprecation_warnings) == 1
+            assert "auth_headers" in str(deprecation_warnings[-1].message)
 
     async def test_load_tool_not_implemented(self, mock_client):
         with pytest.raises(NotImplementedError) as excinfo:
@@ -186,6 +315,13 @@ class TestAsyncToolboxClient:
             excinfo.value
         )
 
+    async def test_load_tools_not_implemented(self, mock_client):
+        with pytest.raises(NotImplementedError) as excinfo:
+            mock_client.load_tools(["test_tool"])
+        assert "Synchronous methods not supported by async client." in str(
+            excinfo.value
+        )
+
     async def test_load_toolset_not_implemented(self, mock_client):
         with pytest.raises(NotImplementedError) as excinfo:
             mock_client.load_toolset()
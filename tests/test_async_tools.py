@@ -13,12 +13,14 @@
 # limitations under the License.
 
 from unittest.mock import AsyncMock, Mock, patch
+from warnings import catch_warnings, simplefilter
 
 import pytest
 import pytest_asyncio
 from pydantic import ValidationError
 
 from toolbox_llamaindex.async_tools import AsyncToolboxTool
+from toolbox_llamaindex.utils import ToolSchema
 
 
 @pytest.mark.asyncio
@@ -96,6 +98,77 @@ class TestAsyncToolboxTool:
         assert tool.metadata.name == "test_tool"
         assert tool.metadata.description == "Test Tool Description"
 
+    @patch("aiohttp.ClientSession")
+    async def test_toolbox_tool_init_with_auth_tokens_insecure(
+        self, mock_client_session, auth_tool_schema
+    ):
+        with pytest.warns(
+            UserWarning,
+            match="Sending ID token over HTTP. User data may be exposed. Use HTTPS for secure communication.",
+        ):
+            AsyncToolboxTool(
+                name="test_tool",
+                schema=auth_tool_schema,
+                url="http://test-url",
+                session=mock_client_session.return_value,
+                auth_tokens={"test-auth-source": lambda: "test-token"},
+            )
+
+    @patch("aiohttp.ClientSession")
+    async def test_toolbox_tool_init_with_auth_tokens_secure(
+        self, mock_client_session, auth_tool_schema
+    ):
+        with catch_warnings():
+            simplefilter("error")
+            AsyncToolboxTool(
+                name="test_tool",
+                schema=auth_tool_schema,
+                url="https://test-url",
+                session=mock_client_session.return_value,
+                auth_tokens={"test-auth-source": lambda: "test-token"},
+            )
+
+    @patch("aiohttp.ClientSession")
+    async def test_toolbox_tool_init_default_args_not_shared(
+        self, mock_client_session, tool_schema
+    ):
+        tools = [
+            AsyncToolboxTool(
+                name="test_tool",
+                schema=tool_schema,
+                url="https://test-url",
+                session=mock_client_session.return_value,
+            )
+            for _ in range(2)
+        ]
+        assert (
+            tools[0]._AsyncToolboxTool__auth_tokens
+            is not tools[1]._AsyncToolboxTool__auth_tokens
+        )
+        assert (
+            tools[0]._AsyncToolboxTool__bound_params
+            is not tools[1]._AsyncToolboxTool__bound_params
+        )
+
+    async def test_toolbox_tool_metadata_reused(self, toolbox_tool):
+        metadata = toolbox_tool.metadata
+        assert toolbox_tool.metadata is metadata
+        assert list(metadata.fn_schema.model_fields) == ["param1", "param2"]
+
+    @patch("aiohttp.ClientSession")
+    async def test_toolbox_tool_init_does_not_mutate_schema(
+        self, mock_client_session, tool_schema
+    ):
+        schema = ToolSchema(**tool_schema)
+        AsyncToolboxTool(
+            name="test_tool",
+            schema=schema,
+            url="https://test-url",
+            session=mock_client_session.return_value,
+            bound_params={"param1": "bound-value"},
+        )
+        assert [param.name for param in schema.parameters] == ["param1", "param2"]
+
     @pytest.mark.parametrize(
         "params, expected_bound_params",
         [
@@ -117,6 +190,14 @@ class TestAsyncToolboxTool:
             else:
                 assert value == tool._AsyncToolboxTool__bound_params[key]
 
+    async def test_toolbox_tool_bind_params_does_not_modify_original(
+        self, toolbox_tool
+    ):
+        toolbox_tool.bind_params({"param1": "bound-value"})
+        assert [
+            param.name for param in toolbox_tool._AsyncToolboxTool__schema.parameters
+        ] == ["param1", "param2"]
+
     @pytest.mark.parametrize("strict", [True, False])
     async def test_toolbox_tool_bind_params_invalid(self, toolbox_tool, strict):
         if strict:
@@ -143,6 +224,15 @@ class TestAsyncToolboxTool:
             e.value
         )
 
+    async def test_toolbox_tool_bind_params_multiple_duplicates(self, toolbox_tool):
+        tool = toolbox_tool.bind_params({"param1": "bound-value", "param2": 123})
+        with pytest.raises(ValueError) as e:
+            tool.bind_params({"param2": 456, "param1": "bound-value"})
+        assert (
+            "Parameter(s) `param1, param2` already bound in tool `test_tool`."
+            in str(e.value)
+        )
+
     async def test_toolbox_tool_bind_params_invalid_params(self, auth_toolbox_tool):
         with pytest.raises(ValueError) as e:
             auth_toolbox_tool.bind_params({"param1": "bound-value"})
@@ -176,6 +266,14 @@ class TestAsyncToolboxTool:
         for source, getter in expected_auth_tokens.items():
             assert tool._AsyncToolboxTool__auth_tokens[source]() == getter()
 
+    async def test_toolbox_tool_add_auth_tokens_reuses_fn_schema(
+        self, auth_toolbox_tool
+    ):
+        tool = auth_toolbox_tool.add_auth_tokens(
+            {"test-auth-source": lambda: "test-token"}
+        )
+        assert tool.metadata.fn_schema is auth_toolbox_tool.metadata.fn_schema
+
     async def test_toolbox_tool_add_auth_tokens_duplicate(self, auth_toolbox_tool):
         tool = auth_toolbox_tool.add_auth_tokens(
             {"test-auth-source": lambda: "test-token"}
@@ -234,6 +332,35 @@ class TestAsyncToolboxTool:
             headers={"test-auth-source_token": "test-token"},
         )
 
+    @patch("aiohttp.ClientSession")
+    async def test_toolbox_tool_call_with_cached_auth_tokens(
+        self, mock_client_session, auth_tool_schema
+    ):
+        mock_session = mock_client_session.return_value
+        mock_session.post.return_value.__aenter__.return_value.raise_for_status = Mock()
+        mock_session.post.return_value.__aenter__.return_value.json = AsyncMock(
+            return_value={"result": "test-result"}
+        )
+        get_id_token = Mock(return_value="test-token")
+        tool = AsyncToolboxTool(
+            name="test_tool",
+            schema=auth_tool_schema,
+            url="https://test-url",
+            session=mock_session,
+            auth_tokens={"test-auth-source": get_id_token},
+            auth_token_ttl=60,
+        )
+
+        await tool.acall(param2=123)
+        await tool.acall(param2=456)
+
+        get_id_token.assert_called_once()
+        mock_session.post.assert_called_with(
+            "https://test-url/api/tool/test_tool/invoke",
+            json={"param2": 456},
+            headers={"test-auth-source_token": "test-token"},
+        )
+
     async def test_toolbox_tool_call_with_auth_tokens_insecure(self, auth_toolbox_tool):
         with pytest.warns(
             UserWarning,
@@ -258,6 +385,31 @@ class TestAsyncToolboxTool:
         assert "param1\n  Input should be a valid string" in str(e.value)
         assert "param2\n  Input should be a valid integer" in str(e.value)
 
+    @patch("aiohttp.ClientSession")
+    async def test_toolbox_tool_call_without_input_validation(
+        self, mock_client_session, tool_schema
+    ):
+        mock_session = mock_client_session.return_value
+        mock_session.post.return_value.__aenter__.return_value.raise_for_status = Mock()
+        mock_session.post.return_value.__aenter__.return_value.json = AsyncMock(
+            return_value={"result": "test-result"}
+        )
+        tool = AsyncToolboxTool(
+            name="test_tool",
+            schema=tool_schema,
+            url="http://test_url",
+            session=mock_session,
+            validate_inputs=False,
+        )
+
+        result = await tool.acall(param1=123)
+        assert result.content == str({"result": "test-result"})
+        mock_session.post.assert_called_once_with(
+            "http://test_url/api/tool/test_tool/invoke",
+            json={"param1": 123},
+            headers={},
+        )
+
     async def test_toolbox_tool_call_with_empty_input(self, toolbox_tool):
         with pytest.raises(ValidationError) as e:
             await toolbox_tool.acall()
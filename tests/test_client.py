@@ -48,6 +48,22 @@ class TestToolboxClient:
 
         return client
 
+    def test_default_session_connector(self, toolbox_client):
+        connector = toolbox_client._ToolboxClient__session.connector
+        assert connector.limit == 100
+        assert connector.limit_per_host == 32
+
+    @patch("toolbox_llamaindex.client.AsyncToolboxClient.__init__", return_value=None)
+    def test_init_validate_inputs(self, mock_async_client_init):
+        client = ToolboxClient(URL, validate_inputs=False)
+        mock_async_client_init.assert_called_once_with(
+            URL,
+            client._ToolboxClient__session,
+            manifest_cache_ttl=0,
+            auth_token_ttl=0,
+            validate_inputs=False,
+        )
+
     @patch("toolbox_llamaindex.client.ToolboxTool.__init__", return_value=None)
     @patch("toolbox_llamaindex.client.AsyncToolboxClient.aload_tool")
     def test_load_tool(
@@ -73,6 +89,37 @@ class TestToolboxClient:
         )
         mock_aload_tool.assert_called_once_with("test_tool", {}, None, {}, True)
 
+    @patch("toolbox_llamaindex.client.ToolboxTool.__init__", return_value=None)
+    @patch("toolbox_llamaindex.client.AsyncToolboxClient.aload_tools")
+    def test_load_tools(
+        self, mock_aload_tools, mock_toolbox_tool_init, toolbox_client, tool_schema
+    ):
+        mock_async_tool1 = Mock(spec=AsyncToolboxTool)
+        mock_async_tool1._AsyncToolboxTool__name = "mock-tool-0"
+        mock_async_tool1._AsyncToolboxTool__schema = tool_schema
+
+        mock_async_tool2 = Mock(spec=AsyncToolboxTool)
+        mock_async_tool2._AsyncToolboxTool__name = "mock-tool-1"
+        mock_async_tool2._AsyncToolboxTool__schema = tool_schema
+        mock_aload_tools.return_value = [mock_async_tool1, mock_async_tool2]
+
+        tools = toolbox_client.load_tools(["mock-tool-0", "mock-tool-1"])
+        assert len(tools) == 2
+        mock_toolbox_tool_init.assert_any_call(
+            mock_async_tool1,
+            toolbox_client._ToolboxClient__loop,
+            toolbox_client._ToolboxClient__thread,
+        )
+        mock_toolbox_tool_init.assert_any_call(
+            mock_async_tool2,
+            toolbox_client._ToolboxClient__loop,
+            toolbox_client._ToolboxClient__thread,
+        )
+
+        mock_aload_tools.assert_called_once_with(
+            ["mock-tool-0", "mock-tool-1"], {}, None, {}, True
+        )
+
     @patch("toolbox_llamaindex.client.ToolboxTool.__init__", return_value=None)
     @patch("toolbox_llamaindex.client.AsyncToolboxClient.aload_toolset")
     def test_load_toolset(
@@ -126,6 +173,26 @@ class TestToolboxClient:
         )
         mock_aload_tool.assert_called_once_with("test_tool", {}, None, {}, True)
 
+    @pytest.mark.asyncio
+    @patch("toolbox_llamaindex.client.ToolboxTool.__init__", return_value=None)
+    @patch("toolbox_llamaindex.client.AsyncToolboxClient.aload_tools")
+    async def test_aload_tools(
+        self, mock_aload_tools, mock_toolbox_tool_init, toolbox_client, tool_schema
+    ):
+        mock_async_tool = Mock(spec=AsyncToolboxTool)
+        mock_async_tool._AsyncToolboxTool__name = "mock-tool"
+        mock_async_tool._AsyncToolboxTool__schema = tool_schema
+        mock_aload_tools.return_value = [mock_async_tool]
+
+        tools = await toolbox_client.aload_tools(["mock-tool"])
+        assert len(tools) == 1
+        mock_toolbox_tool_init.assert_called_once_with(
+            mock_async_tool,
+            toolbox_client._ToolboxClient__loop,
+            toolbox_client._ToolboxClient__thread,
+        )
+        mock_aload_tools.assert_called_once_with(["mock-tool"], {}, None, {}, True)
+
     @pytest.mark.asyncio
     @patch("toolbox_llamaindex.client.ToolboxTool.__init__", return_value=None)
     @patch("toolbox_llamaindex.client.AsyncToolboxClient.aload_toolset")
@@ -12,19 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import asyncio
 import json
 import re
+import sys
 import warnings
 from typing import Union
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import aiohttp
 import pytest
-from pydantic import BaseModel
+import pytest_asyncio
+from pydantic import BaseModel, ValidationError
 
 from toolbox_llamaindex.utils import (
     ParameterSchema,
+    _cache_id_token_getter,
     _get_auth_headers,
     _invoke_tool,
     _load_manifest,
@@ -59,31 +61,28 @@ MOCK_MANIFEST = """
 
 
 class TestUtils:
-    @pytest.fixture(scope="module")
+    @pytest_asyncio.fixture(scope="module", loop_scope="module")
+    async def session(self):
+        session = aiohttp.ClientSession()
+        yield session
+        await session.close()
+
+    @pytest.fixture
     def mock_manifest(self):
-        return aiohttp.ClientResponse(
-            method="GET",
-            url=aiohttp.client.URL(URL),
-            writer=None,
-            continue100=None,
-            timer=None,
-            request_info=None,
-            traces=None,
-            session=None,
-            loop=asyncio.get_event_loop(),
-        )
+        mock_manifest = MagicMock(spec=aiohttp.ClientResponse)
+        mock_manifest.__aenter__ = AsyncMock(return_value=mock_manifest)
+        mock_manifest.__aexit__ = AsyncMock(return_value=None)
+        return mock_manifest
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     @patch("aiohttp.ClientSession.get")
-    async def test_load_manifest(self, mock_get, mock_manifest):
+    async def test_load_manifest(self, mock_get, mock_manifest, session):
         mock_manifest.raise_for_status = Mock()
-        mock_manifest.text = AsyncMock(return_value=MOCK_MANIFEST)
+        mock_manifest.read = AsyncMock(return_value=MOCK_MANIFEST.encode())
 
         mock_get.return_value = mock_manifest
-        session = aiohttp.ClientSession()
         manifest = await _load_manifest(URL, session)
-        await session.close()
-        mock_get.assert_called_once_with(URL)
+        mock_get.assert_called_once_with(URL, headers={"Accept": "application/json"})
 
         assert manifest.serverVersion == "0.0.1"
         assert len(manifest.tools) == 1
@@ -95,56 +94,65 @@ class TestUtils:
             ParameterSchema(name="param2", type="integer", description="Parameter 2"),
         ]
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     @patch("aiohttp.ClientSession.get")
-    async def test_load_manifest_invalid_json(self, mock_get, mock_manifest):
+    async def test_load_manifest_invalid_json(self, mock_get, mock_manifest, session):
         mock_manifest.raise_for_status = Mock()
-        mock_manifest.text = AsyncMock(return_value="{ invalid manifest")
+        mock_manifest.read = AsyncMock(return_value=b"{ invalid manifest")
         mock_get.return_value = mock_manifest
 
         with pytest.raises(Exception) as e:
-            session = aiohttp.ClientSession()
             await _load_manifest(URL, session)
 
-        mock_get.assert_called_once_with(URL)
+        mock_get.assert_called_once_with(URL, headers={"Accept": "application/json"})
         assert isinstance(e.value, json.JSONDecodeError)
         assert (
             str(e.value)
             == "Failed to parse JSON from https://my-toolbox.com/test: Expecting property name enclosed in double quotes: line 1 column 3 (char 2): line 1 column 3 (char 2)"
         )
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     @patch("aiohttp.ClientSession.get")
-    async def test_load_manifest_invalid_manifest(self, mock_get, mock_manifest):
+    async def test_load_manifest_invalid_manifest(
+        self, mock_get, mock_manifest, session
+    ):
         mock_manifest.raise_for_status = Mock()
-        mock_manifest.text = AsyncMock(return_value='{ "something": "invalid" }')
+        mock_manifest.read = AsyncMock(return_value=b'{ "something": "invalid" }')
         mock_get.return_value = mock_manifest
 
         with pytest.raises(Exception) as e:
-            session = aiohttp.ClientSession()
             await _load_manifest(URL, session)
 
-        mock_get.assert_called_once_with(URL)
+        mock_get.assert_called_once_with(URL, headers={"Accept": "application/json"})
         assert isinstance(e.value, ValueError)
         assert re.match(
             r"Invalid JSON data from https://my-toolbox.com/test: 2 validation errors for ManifestSchema\nserverVersion\n  Field required \[type=missing, input_value={'something': 'invalid'}, input_type=dict]\n    For further information visit https://errors.pydantic.dev/\d+\.\d+/v/missing\ntools\n  Field required \[type=missing, input_value={'something': 'invalid'}, input_type=dict]\n    For further information visit https://errors.pydantic.dev/\d+\.\d+/v/missing",
             str(e.value),
         )
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     @patch("aiohttp.ClientSession.get")
-    async def test_load_manifest_api_error(self, mock_get, mock_manifest):
+    async def test_load_manifest_api_error(self, mock_get, mock_manifest, session):
         error = aiohttp.ClientError("Simulated HTTP Error")
         mock_manifest.raise_for_status = Mock()
-        mock_manifest.text = AsyncMock(side_effect=error)
+        mock_manifest.read = AsyncMock(side_effect=error)
         mock_get.return_value = mock_manifest
 
         with pytest.raises(aiohttp.ClientError) as exc_info:
-            session = aiohttp.ClientSession()
             await _load_manifest(URL, session)
-        mock_get.assert_called_once_with(URL)
+        mock_get.assert_called_once_with(URL, headers={"Accept": "application/json"})
         assert exc_info.value == error
 
+    def test_parameter_schema_frozen(self):
+        param = ParameterSchema(name="param1", type="string", description="Param 1")
+        with pytest.raises(ValidationError):
+            param.name = "param2"
+
+    def test_parameter_schema_name_interned(self):
+        name = "".join(["param", "1"])
+        param = ParameterSchema(name=name, type="string", description="Param 1")
+        assert param.name is sys.intern("param1")
+
     def test_schema_to_model(self):
         schema = [
             ParameterSchema(name="param1", type="string", description="Parameter 1"),
@@ -158,6 +166,21 @@ class TestUtils:
         assert model.model_fields["param2"].annotation == int
         assert model.model_fields["param2"].description == "Parameter 2"
 
+    def test_schema_to_model_cached(self):
+        schema = [
+            ParameterSchema(name="param1", type="string", description="Parameter 1"),
+        ]
+        model = _schema_to_model("TestCachedModel", schema)
+        same_schema = [
+            ParameterSchema(name="param1", type="string", description="Parameter 1"),
+        ]
+        assert _schema_to_model("TestCachedModel", same_schema) is model
+
+        other_schema = [
+            ParameterSchema(name="param1", type="integer", description="Parameter 1"),
+        ]
+        assert _schema_to_model("TestCachedModel", other_schema) is not model
+
     def test_schema_to_model_empty(self):
         model = _schema_to_model("TestModel", [])
         assert issubclass(model, BaseModel)
@@ -186,6 +209,15 @@ class TestUtils:
     def test_parse_type(self, parameter_schema, expected_type):
         assert _parse_type(parameter_schema) == expected_type
 
+    def test_parse_type_array_cached(self):
+        schema = ParameterSchema(
+            name="foo",
+            description="bar",
+            type="array",
+            items=ParameterSchema(name="foo", description="bar", type="string"),
+        )
+        assert _parse_type(schema) is _parse_type(schema)
+
     @pytest.mark.parametrize(
         "fail_parameter_schema",
         [
@@ -206,18 +238,17 @@ class TestUtils:
         with pytest.raises(ValueError):
             _parse_type(fail_parameter_schema)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     @patch("aiohttp.ClientSession.post")
-    async def test_invoke_tool(self, mock_post):
+    async def test_invoke_tool(self, mock_post, session):
         mock_response = Mock()
         mock_response.raise_for_status = Mock()
         mock_response.json = AsyncMock(return_value={"key": "value"})
         mock_post.return_value.__aenter__.return_value = mock_response
 
         result = await _invoke_tool(
-            "http://localhost:8000",
-            aiohttp.ClientSession(),
-            "tool_name",
+            "http://localhost:8000/api/tool/tool_name/invoke",
+            session,
             {"input": "data"},
             {},
         )
@@ -229,37 +260,9 @@ class TestUtils:
         )
         assert result == {"key": "value"}
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     @patch("aiohttp.ClientSession.post")
-    async def test_invoke_tool_unsecure_with_auth(self, mock_post):
-        mock_response = Mock()
-        mock_response.raise_for_status = Mock()
-        mock_response.json = AsyncMock(return_value={"key": "value"})
-        mock_post.return_value.__aenter__.return_value = mock_response
-
-        with pytest.warns(
-            UserWarning,
-            match="Sending ID token over HTTP. User data may be exposed. Use HTTPS for secure communication.",
-        ):
-            result = await _invoke_tool(
-                "http://localhost:8000",
-                aiohttp.ClientSession(),
-                "tool_name",
-                {"input": "data"},
-                {"my_test_auth": lambda: "fake_id_token"},
-            )
-
-        mock_post.assert_called_once_with(
-            "http://localhost:8000/api/tool/tool_name/invoke",
-            json={"input": "data"},
-            headers={"my_test_auth_token": "fake_id_token"},
-        )
-        assert result == {"key": "value"}
-
-    @pytest.mark.asyncio
-    @patch("aiohttp.ClientSession.post")
-    async def test_invoke_tool_secure_with_auth(self, mock_post):
-        session = aiohttp.ClientSession()
+    async def test_invoke_tool_with_auth(self, mock_post, session):
         mock_response = Mock()
         mock_response.raise_for_status = Mock()
         mock_response.json = AsyncMock(return_value={"key": "value"})
@@ -268,15 +271,14 @@ class TestUtils:
         with warnings.catch_warnings():
             warnings.simplefilter("error")
             result = await _invoke_tool(
-                "https://localhost:8000",
+                "http://localhost:8000/api/tool/tool_name/invoke",
                 session,
-                "tool_name",
                 {"input": "data"},
-                {"my_test_auth": lambda: "fake_id_token"},
+                {"my_test_auth_token": "fake_id_token"},
             )
 
         mock_post.assert_called_once_with(
-            "https://localhost:8000/api/tool/tool_name/invoke",
+            "http://localhost:8000/api/tool/tool_name/invoke",
             json={"input": "data"},
             headers={"my_test_auth_token": "fake_id_token"},
         )
@@ -289,3 +291,18 @@ class TestUtils:
             match=r"Call to deprecated function \(or staticmethod\) _get_auth_headers\. \(Please use `_get_auth_tokens` instead\.\)$",
         ):
             _get_auth_headers({"auth_source1": lambda: "test_token"})
+
+    @patch("toolbox_llamaindex.utils.time.monotonic")
+    def test_cache_id_token_getter(self, mock_monotonic):
+        get_id_token = Mock(side_effect=["token1", "token2"])
+        cached_get_id_token = _cache_id_token_getter(get_id_token, ttl=10)
+
+        mock_monotonic.return_value = 100.0
+        assert cached_get_id_token() == "token1"
+        mock_monotonic.return_value = 109.0
+        assert cached_get_id_token() == "token1"
+        get_id_token.assert_called_once()
+
+        mock_monotonic.return_value = 110.0
+        assert cached_get_id_token() == "token2"
+        assert get_id_token.call_count == 2